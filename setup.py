@@ -20,6 +20,9 @@ setup(
     install_requires=[
         "numpy", "scipy", "matplotlib", "scikit-learn", 'fire'
     ],
+    extras_require={
+        "numba": ["numba"],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'Intended Audience :: Science/Research',
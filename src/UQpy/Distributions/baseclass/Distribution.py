@@ -1,3 +1,5 @@
+import sys
+
 ########################################################################################################################
 #        Define the probability distribution of the random parameters
 ########################################################################################################################
@@ -175,6 +177,9 @@ class Distribution:
             self.order_params = tuple(kwargs.keys())
         if len(self.order_params) != len(self.params):
             raise ValueError('Inconsistent dimensions between order_params tuple and params dictionary.')
+        self.order_params = tuple(sys.intern(name) for name in self.order_params)
+        # The parameter names of a distribution are fixed at construction, validate updates against them.
+        self._valid_params = frozenset(self.params)
 
     def update_params(self, **kwargs):
         """
@@ -190,10 +195,11 @@ class Distribution:
             Parameters to be updated, designated by their respective keywords.
 
         """
-        for key in kwargs.keys():
-            if key not in self.get_params().keys():
+        params = self.params
+        for key, value in kwargs.items():
+            if key not in self._valid_params:
                 raise ValueError('Wrong parameter name.')
-            self.params[key] = kwargs[key]
+            params[key] = value
 
     def get_params(self):
         """
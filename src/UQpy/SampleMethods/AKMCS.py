@@ -1,7 +1,37 @@
+import math
+
 import numpy as np
-import scipy.stats as stats
+from scipy.special import ndtr
 
 from UQpy.SampleMethods.LHS import LHS
+from UQpy.Utilities import _import_numba
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+# Compiled on the first call to AKMCS.eif, None when numba is not installed.
+_eif_kernel = False
+
+
+def _build_eif_kernel(numba):
+    @numba.njit(parallel=True, cache=True, error_model='numpy')
+    def kernel(g, sig, fm, out):
+        # Fused evaluation of the expected improvement, one pass over the learning set.
+        for i in numba.prange(g.shape[0]):
+            d = fm - g[i]
+            z = d / sig[i]
+            cdf = 0.5 * math.erfc(-z * 0.7071067811865476)
+            pdf = _INV_SQRT_2PI * math.exp(-0.5 * z * z)
+            out[i] = d * cdf + sig[i] * pdf
+    return kernel
+
+
+def _get_eif_kernel():
+    global _eif_kernel
+    if _eif_kernel is False:
+        numba = _import_numba()
+        _eif_kernel = None if numba is None else _build_eif_kernel(numba)
+    return _eif_kernel
+
 ########################################################################################################################
 ########################################################################################################################
 #                                  Adaptive Kriging-Monte Carlo Simulation (AK-MCS)
@@ -273,6 +303,7 @@ class AKMCS:
                 self.qoi[j] = self.runmodel_object.qoi_list[j][self.qoi_name]
         else:
             self.qoi = self.runmodel_object.qoi_list
+        self.qoi = np.asarray(self.qoi, dtype=np.float64)
 
         # Train the initial Kriging model.
         self.krig_object.fit(self.samples, self.qoi)
@@ -315,6 +346,7 @@ class AKMCS:
                     self.qoi[j] = self.runmodel_object.qoi_list[j][self.qoi_name]
             else:
                 self.qoi = self.runmodel_object.qoi_list
+            self.qoi = np.asarray(self.qoi, dtype=np.float64)
 
             # Retrain the surrogate model
             self.krig_object.fit(self.samples, self.qoi, nopt=1)
@@ -360,8 +392,8 @@ class AKMCS:
         * **samples** (`ndarray`):
             The initial samples at which to evaluate the model.
 
-        * **qoi** (`list`):
-            A list, which contaains the model evaluations.
+        * **qoi** (`ndarray`):
+            A float64 array containing the model evaluations at `samples`.
 
         * **dist_object** ((list of) ``Distribution`` object(s)):
             List of ``Distribution`` objects corresponding to each random variable.
@@ -403,7 +435,7 @@ class AKMCS:
 
         # Compute the learning function at every point in the population.
         u = np.square(g - qoi_array) + np.square(sig)
-        rows = u[:, 0].argsort()[(np.size(g) - n_add):]
+        rows = u[:, 0].argsort()[(g.shape[0] - n_add):]
 
         indicator = False
         new_samples = pop[rows, :]
@@ -437,8 +469,8 @@ class AKMCS:
         * **samples** (`ndarray`):
             The initial samples at which to evaluate the model.
 
-        * **qoi** (`list`):
-            A list, which contaains the model evaluations.
+        * **qoi** (`ndarray`):
+            A float64 array containing the model evaluations at `samples`.
 
         * **dist_object** ((list of) ``Distribution`` object(s)):
             List of ``Distribution`` objects corresponding to each random variable.
@@ -504,8 +536,8 @@ class AKMCS:
         * **samples** (`ndarray`):
             The initial samples at which to evaluate the model.
 
-        * **qoi** (`list`):
-            A list, which contaains the model evaluations.
+        * **qoi** (`ndarray`):
+            A float64 array containing the model evaluations at `samples`.
 
         * **dist_object** ((list of) ``Distribution`` object(s)):
             List of ``Distribution`` objects corresponding to each random variable.
@@ -580,8 +612,8 @@ class AKMCS:
         * **samples** (`ndarray`):
             The initial samples at which to evaluate the model.
 
-        * **qoi** (`list`):
-            A list, which contaains the model evaluations.
+        * **qoi** (`ndarray`):
+            A float64 array containing the model evaluations at `samples`.
 
         * **dist_object** ((list of) ``Distribution`` object(s)):
             List of ``Distribution`` objects corresponding to each random variable.
@@ -615,9 +647,11 @@ class AKMCS:
         t1 = (a_ - g) / sig
         t2 = (a_ - ep - g) / sig
         t3 = (a_ + ep - g) / sig
-        eff = (g - a_) * (2 * stats.norm.cdf(t1) - stats.norm.cdf(t2) - stats.norm.cdf(t3))
-        eff += -sig * (2 * stats.norm.pdf(t1) - stats.norm.pdf(t2) - stats.norm.pdf(t3))
-        eff += ep * (stats.norm.cdf(t3) - stats.norm.cdf(t2))
+        cdf1, cdf2, cdf3 = ndtr(t1), ndtr(t2), ndtr(t3)
+        pdf1, pdf2, pdf3 = [np.exp(-0.5 * t * t) * _INV_SQRT_2PI for t in (t1, t2, t3)]
+        eff = (g - a_) * (2 * cdf1 - cdf2 - cdf3)
+        eff += -sig * (2 * pdf1 - pdf2 - pdf3)
+        eff += ep * (cdf3 - cdf2)
         rows = eff[:, 0].argsort()[-n_add:]
 
         indicator = False
@@ -655,8 +689,8 @@ class AKMCS:
         * **samples** (`ndarray`):
             The initial samples at which to evaluate the model.
 
-        * **qoi** (`list`):
-            A list, which contaains the model evaluations.
+        * **qoi** (`ndarray`):
+            A float64 array containing the model evaluations at `samples`.
 
         * **dist_object** ((list of) ``Distribution`` object(s)):
             List of ``Distribution`` objects corresponding to each random variable.
@@ -679,20 +713,46 @@ class AKMCS:
         parameters = kwargs['parameters']
         qoi = kwargs['qoi']
 
+        # No copy for the learning set built by AKMCS.run, fancy indexing below then takes the contiguous fast path
+        pop = np.ascontiguousarray(pop, dtype=np.float64)
+
         g, sig = surr(pop, True)
 
-        # Remove the inconsistency in the shape of 'g' and 'sig' array
-        g = g.reshape([pop.shape[0], 1])
-        sig = sig.reshape([pop.shape[0], 1])
+        # Work on flat arrays, the surrogate may return either (n,) or (n, 1) shapes
+        g = np.ravel(g)
+        sig = np.ravel(sig)
 
-        fm = min(qoi)
-        eif = (fm - g) * stats.norm.cdf((fm - g) / sig) + sig * stats.norm.pdf((fm - g) / sig)
-        rows = eif[:, 0].argsort()[(np.size(g) - n_add):]
+        fm = np.min(qoi)
+        eif_kernel = _get_eif_kernel()
+        if eif_kernel is not None:
+            eif = np.empty(pop.shape[0])
+            eif_kernel(np.ascontiguousarray(g, dtype=np.float64), np.ascontiguousarray(sig, dtype=np.float64),
+                        float(fm), eif)
+        else:
+            # Reuse the improvement and a single work buffer to avoid full-size temporaries
+            diff = fm - g
+            z = diff * (1.0 / sig)
+            eif = ndtr(z)
+            eif *= diff
+            np.multiply(z, z, out=z)
+            z *= -0.5
+            np.exp(z, out=z)
+            z *= sig
+            z *= _INV_SQRT_2PI
+            eif += z
+        if n_add == 1:
+            # Common case, a single argmax gives both the new sample and the maximum EIF
+            rows = np.array([np.argmax(eif)])
+        else:
+            # Only the n_add largest values are needed, partition rather than sort the full learning set
+            idx = np.argpartition(eif, -n_add)[-n_add:]
+            rows = idx[np.argsort(eif[idx])]
 
+        # rows is sorted in ascending order, so its last entry already holds the maximum EIF
         indicator = False
-        if max(eif[:, 0]) / abs(fm) <= parameters['eif_stop']:
+        if eif[rows[-1]] / abs(fm) <= parameters['eif_stop']:
             indicator = True
 
-        new_samples = pop[rows, :]
-        eif_lf = eif[rows, :]
-        return new_samples, eif_lf, indicator
\ No newline at end of file
+        new_samples = pop[rows]
+        eif_lf = eif[rows]
+        return new_samples, eif_lf, indicator
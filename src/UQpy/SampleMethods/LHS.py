@@ -1,7 +1,6 @@
 from UQpy.Distributions import *
 import numpy as np
 from scipy.spatial.distance import pdist
-import scipy.stats as stats
 import copy
 
 ########################################################################################################################
@@ -36,11 +35,12 @@ class LHS:
                 4. 'correlate' - minimizing the correlation between the points. \n
                 5. `callable` - User-defined method.
 
-    * **random_state** (None or `int` or ``numpy.random.RandomState`` object):
+    * **random_state** (None or `int` or ``numpy.random.RandomState`` or ``numpy.random.Generator`` object):
         Random seed used to initialize the pseudo-random number generator. Default is None.
 
         If an integer is provided, this sets the seed for an object of ``numpy.random.RandomState``. Otherwise, the
-        object itself can be passed directly.
+        object itself can be passed directly. Passing a ``numpy.random.Generator`` (e.g., from
+        ``numpy.random.default_rng``) uses the faster PCG64 bit generator for all draws.
 
     * **verbose** (`Boolean`):
         A boolean declaring whether to write text to the terminal.
@@ -80,8 +80,9 @@ class LHS:
         self.random_state = random_state
         if isinstance(self.random_state, int):
             self.random_state = np.random.RandomState(self.random_state)
-        elif not isinstance(self.random_state, (type(None), np.random.RandomState)):
-            raise TypeError('UQpy: random_state must be None, an int or an np.random.RandomState object.')
+        elif not isinstance(self.random_state, (type(None), np.random.RandomState, np.random.Generator)):
+            raise TypeError('UQpy: random_state must be None, an int, an np.random.RandomState or an '
+                            'np.random.Generator object.')
 
         if isinstance(criterion, str):
             if criterion not in ['random', 'centered', 'maximin', 'correlate']:
@@ -147,11 +148,15 @@ class LHS:
         a = cut[:self.nsamples]
         b = cut[1:self.nsamples + 1]
 
-        u = np.zeros(shape=(self.samples.shape[0], self.samples.shape[1]))
-        samples = np.zeros_like(u)
-        for i in range(self.samples.shape[1]):
-            u[:, i] = stats.uniform.rvs(size=self.samples.shape[0], random_state=self.random_state)
-            samples[:, i] = u[:, i] * (b - a) + a
+        # Draw all dimensions at once; drawing (d, n) and transposing preserves the column-wise random stream and
+        # yields a Fortran-ordered array, so the per-dimension operations of the criteria are unit-stride.
+        n, d = self.samples.shape
+        if self.random_state is not None:
+            samples = self.random_state.uniform(size=(d, n)).T
+        else:
+            samples = np.random.uniform(size=(d, n)).T
+        samples *= (b - a)[:, None]
+        samples += a[:, None]
 
         if self.criterion == 'random' or self.criterion is None:
             u_lhs = self.random(samples, random_state=self.random_state)
@@ -198,8 +203,9 @@ class LHS:
         * **samples** (`ndarray`):
             A set of samples drawn from within each bin.
 
-        * **random_state** (``numpy.random.RandomState`` object):
-            A ``numpy.RandomState`` object that fixes the seed of the pseudo random number generation.
+        * **random_state** (``numpy.random.RandomState`` or ``numpy.random.Generator`` object):
+            A ``numpy.RandomState`` or ``numpy.random.Generator`` object that fixes the seed of the pseudo random
+            number generation.
 
         **Output/Returns:**
 
@@ -227,8 +233,9 @@ class LHS:
         * **samples** (`ndarray`):
             A set of samples drawn from within each LHS bin.
 
-        * **random_state** (``numpy.random.RandomState`` object):
-            A ``numpy.RandomState`` object that fixes the seed of the pseudo random number generation.
+        * **random_state** (``numpy.random.RandomState`` or ``numpy.random.Generator`` object):
+            A ``numpy.RandomState`` or ``numpy.random.Generator`` object that fixes the seed of the pseudo random
+            number generation.
 
         * **iterations** (`int`):
             The number of iteration to run in the search for a maximin design.
@@ -292,8 +299,9 @@ class LHS:
         * **samples** (`ndarray`):
             A set of samples drawn from within each LHS bin.
 
-        * **random_state** (``numpy.random.RandomState`` object):
-            A ``numpy.RandomState`` object that fixes the seed of the pseudo random number generation.
+        * **random_state** (``numpy.random.RandomState`` or ``numpy.random.Generator`` object):
+            A ``numpy.RandomState`` or ``numpy.random.Generator`` object that fixes the seed of the pseudo random
+            number generation.
 
         * **iterations** (`int`):
             The number of iteration to run in the search for a maximin design.
@@ -338,8 +346,9 @@ class LHS:
         * **samples** (`ndarray`):
             A set of samples drawn from within each LHS bin. In this method, the samples passed in are not used.
 
-        * **random_state** (``numpy.random.RandomState`` object):
-            A ``numpy.RandomState`` object that fixes the seed of the pseudo random number generation.
+        * **random_state** (``numpy.random.RandomState`` or ``numpy.random.Generator`` object):
+            A ``numpy.RandomState`` or ``numpy.random.Generator`` object that fixes the seed of the pseudo random
+            number generation.
 
         * **a** (`ndarray`)
             An array of the bin lower-bounds.
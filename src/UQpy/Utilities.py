@@ -21,6 +21,20 @@ import scipy.stats as stats
 from UQpy.RunModel import RunModel
 
 
+def _import_numba():
+    """
+    Return the ``numba`` module, or None if it is not installed.
+
+    ``numba`` is an optional dependency (``pip install UQpy[numba]``). It is imported on demand by the code that uses it
+    so that ``import UQpy`` does not pay for it.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba
+
+
 def svd(matrix, rank=None, tol=None):
     """
     Compute the singular value decomposition (SVD) of a matrix.
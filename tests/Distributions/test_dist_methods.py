@@ -1,5 +1,6 @@
 from UQpy.Distributions import *
 import numpy as np
+import pytest
 
 # Test all functions for one type of continuous distribution: uniform
 dist_continuous = Uniform(loc=1., scale=2.)
@@ -15,6 +16,12 @@ def test_update_params():
     assert dist.get_params()['loc'] == 2.
 
 
+def test_update_params_wrong_name():
+    dist = Uniform(loc=1., scale=2.)
+    with pytest.raises(ValueError):
+        dist.update_params(shape=2.)
+
+
 def test_continuous_pdf():
     assert dist_continuous.pdf(x=1.5) == 0.5
 
@@ -0,0 +1 @@
+from tests.SampleMethods import *
\ No newline at end of file
@@ -0,0 +1,74 @@
+from UQpy.SampleMethods import AKMCS
+import importlib
+import numpy as np
+import pytest
+import scipy.stats as stats
+
+akmcs_module = importlib.import_module('UQpy.SampleMethods.AKMCS')
+
+# Kriging mean and standard deviation at each learning point. The entry at g = 20.5 lies deep in the lower tail of the
+# normal cdf and the last two entries have zero predicted standard deviation.
+g = np.array([-1., 0.2, 0.4, 0.45, 1., 3., 20.5, 0.1, 2.])
+sig = np.array([0.5, 1., 0.1, 0.3, 2., 1., 1., 0., 0.])
+qoi = np.array([0.5, 1., 2.])
+pop = np.arange(2. * g.size).reshape(g.size, 2)
+
+
+def surr(x, return_std):
+    return g.reshape(-1, 1), sig.reshape(-1, 1)
+
+
+def eif_reference():
+    fm = min(qoi)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (fm - g) * stats.norm.cdf((fm - g) / sig) + sig * stats.norm.pdf((fm - g) / sig)
+
+
+@pytest.fixture(params=['numba', 'numpy'])
+def eif_path(request, monkeypatch):
+    if request.param == 'numba':
+        pytest.importorskip('numba')
+        monkeypatch.setattr(akmcs_module, '_eif_kernel', False)
+    else:
+        monkeypatch.setattr(akmcs_module, '_eif_kernel', None)
+    return request.param
+
+
+def test_eif_n_add_1(eif_path):
+    ref = eif_reference()
+    new_samples, eif_lf, indicator = AKMCS.eif(surr, pop, n_add=1, parameters={'eif_stop': 0.01}, qoi=qoi)
+    assert np.array_equal(new_samples, pop[[np.argmax(ref)]])
+    np.testing.assert_allclose(eif_lf, [ref.max()], rtol=1e-12)
+
+
+def test_eif_n_add_3_ascending(eif_path):
+    ref = eif_reference()
+    rows = np.argsort(ref)[-3:]
+    new_samples, eif_lf, indicator = AKMCS.eif(surr, pop, n_add=3, parameters={'eif_stop': 0.01}, qoi=qoi)
+    assert np.array_equal(new_samples, pop[rows])
+    assert np.all(np.diff(eif_lf) > 0)
+    np.testing.assert_allclose(eif_lf, ref[rows], rtol=1e-12)
+
+
+def test_eif_all_values_match_scipy(eif_path):
+    # Selecting every point returns the whole learning function, including the tail and zero-sigma entries.
+    ref = eif_reference()
+    new_samples, eif_lf, indicator = AKMCS.eif(surr, pop, n_add=g.size, parameters={'eif_stop': 0.01}, qoi=qoi)
+    assert np.array_equal(new_samples, pop[np.argsort(ref)])
+    np.testing.assert_allclose(eif_lf, np.sort(ref), rtol=1e-9, atol=0)
+
+
+def test_eif_zero_sigma(eif_path):
+    # With sig == 0 the improvement is deterministic, max(fm - g, 0).
+    ref = eif_reference()
+    new_samples, eif_lf, indicator = AKMCS.eif(surr, pop, n_add=g.size, parameters={'eif_stop': 0.01}, qoi=qoi)
+    assert eif_lf[np.flatnonzero(np.all(new_samples == pop[7], axis=1))[0]] == pytest.approx(0.4)
+    assert eif_lf[np.flatnonzero(np.all(new_samples == pop[8], axis=1))[0]] == 0.
+    assert ref[7] == pytest.approx(0.4) and ref[8] == 0.
+
+
+@pytest.mark.parametrize('n_add', [1, 3])
+def test_eif_indicator(eif_path, n_add):
+    ratio = eif_reference().max() / abs(min(qoi))
+    assert AKMCS.eif(surr, pop, n_add=n_add, parameters={'eif_stop': 1.01 * ratio}, qoi=qoi)[2]
+    assert not AKMCS.eif(surr, pop, n_add=n_add, parameters={'eif_stop': 0.99 * ratio}, qoi=qoi)[2]
@@ -0,0 +1,41 @@
+from UQpy.SampleMethods import LHS
+from UQpy.Distributions import Uniform
+import numpy as np
+import pytest
+import scipy.stats as stats
+
+dist = [Uniform(loc=0., scale=1.), Uniform(loc=0., scale=1.), Uniform(loc=0., scale=1.)]
+nsamples = 7
+
+
+def test_seeded_bins_match_columnwise_draws():
+    # Bin samples must be identical to drawing and scaling each dimension separately.
+    random_state = np.random.RandomState(3)
+    cut = np.linspace(0, 1, nsamples + 1)
+    a, b = cut[:nsamples], cut[1:nsamples + 1]
+    samples = np.zeros((nsamples, len(dist)))
+    for i in range(len(dist)):
+        u = stats.uniform.rvs(size=nsamples, random_state=random_state)
+        samples[:, i] = u * (b - a) + a
+    expected = LHS.random(samples, random_state=random_state)
+
+    x = LHS(dist_object=dist, nsamples=nsamples, criterion='random', random_state=3)
+    assert np.array_equal(x.samplesU01, expected)
+
+
+@pytest.mark.parametrize('criterion', ['random', 'centered', 'maximin', 'correlate'])
+def test_generator_random_state(criterion):
+    x = LHS(dist_object=dist, nsamples=nsamples, criterion=criterion, random_state=np.random.default_rng(123))
+    # Exactly one sample falls in each of the nsamples strata of every dimension.
+    strata = np.floor(x.samplesU01 * nsamples).astype(int)
+    for j in range(len(dist)):
+        assert np.array_equal(np.sort(strata[:, j]), np.arange(nsamples))
+
+    y = LHS(dist_object=dist, nsamples=nsamples, criterion=criterion, random_state=np.random.default_rng(123))
+    assert np.array_equal(x.samplesU01, y.samplesU01)
+    assert np.array_equal(x.samples, y.samples)
+
+
+def test_invalid_random_state():
+    with pytest.raises(TypeError):
+        LHS(dist_object=dist, nsamples=nsamples, random_state='123')
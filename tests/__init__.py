@@ -1,3 +1,5 @@
 import tests.Surrogates
+import tests.SampleMethods
 
-from tests.Surrogates import *
\ No newline at end of file
+from tests.Surrogates import *
+from tests.SampleMethods import *